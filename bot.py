@@ -16,13 +16,32 @@ Features:
 import discord
 from discord.ext import commands
 from discord import app_commands
+from discord.utils import utcnow
+import copy
 import json
+import logging
+import logging.handlers
 import os
+import re
+import sys
 import asyncio
-import datetime
+import queue
 from dotenv import load_dotenv
 import secrets
 
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to the standard library
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup - not available on Windows
+    uvloop = None
+
+
+
+logger = logging.getLogger("verification")
 
 
 # =============================================================================
@@ -36,6 +55,8 @@ DEFAULT_CONFIG = {
     "welcome_channel_id": None,          # Channel where welcome messages are sent
     "verification_category_id": None,     # Category for ticket channels
     "log_channel_id": None,               # Channel for government decision logs
+    "log_webhook_url": None,              # Optional webhook for decision logs (separate rate limit)
+    "guild_id": None,                     # Server to sync slash commands to (None = global sync)
     "roles": {
         "local_role": None,               # Role granted to approved citizens
         "foreigner": None,                # Role granted to approved foreigners
@@ -56,7 +77,21 @@ DEFAULT_CONFIG = {
 }
 
 
-def load_config() -> dict:
+def _loads_config(data: bytes) -> dict:
+    """Parse raw config file contents."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_config(config: dict) -> bytes:
+    """Serialize config with pretty formatting."""
+    if orjson:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=4).encode()
+
+
+def _read_config_file() -> dict:
     """
     Load configuration from JSON file.
 
@@ -64,20 +99,86 @@ def load_config() -> dict:
     all required keys exist. If not, returns a copy of defaults.
     """
     if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
+        with open(CONFIG_FILE, "rb") as f:
+            config = _loads_config(f.read())
             # Merge with defaults for any missing keys (handles config upgrades)
             for key, value in DEFAULT_CONFIG.items():
                 if key not in config:
                     config[key] = value
             return config
-    return DEFAULT_CONFIG.copy()
+    return copy.deepcopy(DEFAULT_CONFIG)
+
+
+def _config_mtime():
+    """Return the modification time of the config file, or None if it doesn't exist."""
+    try:
+        return os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class ConfigCache:
+    """
+    In-memory copy of the configuration.
+
+    The file is only parsed again when its modification time changes
+    (e.g. it was edited by hand), so handlers can call get_config()
+    freely without touching the disk on every interaction.
+    """
+
+    def __init__(self):
+        self.mtime = None
+        self.data = None
+
+    def get(self) -> dict:
+        # While one of our own writes is in flight the file's mtime changes
+        # before update() records it; re-reading then would hand out a second
+        # dict and split the state between handlers
+        if self.data is not None and _config_write_lock.locked():
+            return self.data
+        mtime = _config_mtime()
+        if self.data is None or mtime != self.mtime:
+            self.data = _read_config_file()
+            self.mtime = mtime
+        return self.data
+
+    def update(self, config: dict) -> None:
+        """Record a config that was just written to disk."""
+        self.data = config
+        self.mtime = _config_mtime()
+
+
+_config_cache = ConfigCache()
+
+
+def get_config() -> dict:
+    """Return the current configuration, re-reading the file only if it changed."""
+    return _config_cache.get()
 
 
-def save_config(config: dict) -> None:
-    """Save configuration to JSON file with pretty formatting."""
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=4)
+def _write_config_file(data: bytes) -> None:
+    """Write serialized config atomically so readers never see a partial file."""
+    tmp_file = CONFIG_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file, CONFIG_FILE)
+
+
+# Serializes config writes so they land on disk in the order they were made
+_config_write_lock = asyncio.Lock()
+
+
+async def _save_config_async(config: dict) -> None:
+    """
+    Save configuration without blocking the event loop.
+
+    The config is serialized on the event loop (so it can't change mid-dump)
+    and only the disk write is handed off to a worker thread.
+    """
+    data = _dumps_config(config)
+    async with _config_write_lock:
+        await asyncio.to_thread(_write_config_file, data)
+        _config_cache.update(config)
 
 
 # =============================================================================
@@ -91,7 +192,51 @@ intents.message_content = True  # Required: Read message content
 intents.guilds = True           # Required: Access guild information
 
 bot = commands.Bot(command_prefix="!", intents=intents)
-config = load_config()
+
+
+class ResolvedConfig:
+    """
+    Configured roles and channels resolved to Discord objects.
+
+    Built for one guild from one config dict and kept on bot.resolved, so
+    moderation commands don't repeat the ID lookups on every call.
+    """
+
+    def __init__(self, guild: discord.Guild, config: dict):
+        self.guild_id = guild.id
+        self.config = config
+        self.log_channel = guild.get_channel(config["log_channel_id"]) if config.get("log_channel_id") else None
+        # Webhook posts use their own rate-limit bucket and reuse the bot's HTTP session
+        self.log_webhook = None
+        if config.get("log_webhook_url"):
+            try:
+                self.log_webhook = discord.Webhook.from_url(config["log_webhook_url"], client=bot)
+            except ValueError:
+                # Don't echo the URL - even a malformed one may contain the webhook token
+                logger.warning("Invalid log webhook URL in config - check log_webhook_url")
+        # Hand-edited configs may lack some role keys (defaults are only merged
+        # at the top level), so treat missing ones as unset
+        roles = config.get("roles") or {}
+        self.local_role = guild.get_role(roles.get("local_role"))
+        self.foreigner_role = guild.get_role(roles.get("foreigner"))
+        self.mod_role_ids = frozenset(filter(None, (
+            roles.get("border_control"),
+            roles.get("minister_foreign_affairs"),
+            roles.get("president"),
+            roles.get("vice_president")
+        )))
+
+
+# Dropped (set to None) whenever roles/channels change or the config is edited
+bot.resolved = None
+
+
+def get_resolved(guild: discord.Guild, config: dict) -> ResolvedConfig:
+    """Return the resolved config for a guild, rebuilding it if it's stale."""
+    resolved = bot.resolved
+    if resolved is None or resolved.guild_id != guild.id or resolved.config is not config:
+        resolved = bot.resolved = ResolvedConfig(guild, config)
+    return resolved
 
 
 # =============================================================================
@@ -140,124 +285,176 @@ class WelcomeView(discord.ui.View):
         await create_verification_channel(interaction, "embassy")
 
 
+# Shared persistent view, created in setup_hook once the event loop is running
+welcome_view = None
+
+
 # =============================================================================
 # TICKET CHANNEL CREATION
 # =============================================================================
 
-async def create_verification_channel(interaction: discord.Interaction, request_type: str) -> None:
-    """
-    Create a private verification ticket channel for the user.
+# Serializes ticket counter increments across simultaneous button presses
+ticket_lock = asyncio.Lock()
 
-    Args:
-        interaction: The button interaction from the user
-        request_type: One of "citizen", "foreigner", or "embassy"
+# Open tickets by channel ID: {"user_id", "type", "ticket_id"}. Filled in as
+# tickets are created and rebuilt from channel topics in on_ready.
+TICKETS: dict[int, dict] = {}
 
-    The channel is only visible to:
-    - The requesting user
-    - The bot itself
-    - The relevant moderator roles (Border Control or Embassy handlers)
-    """
-    global config
-    config = load_config()
-    password_length = 13
 
-    displayed_text = ""
-    guild = interaction.guild
-    user = interaction.user
+def _parse_ticket_topic(topic: str | None) -> dict | None:
+    """
+    Parse ticket metadata from a ticket channel's topic.
 
-    # Generate unique ticket ID
-    config["ticket_counter"] += 1
-    ticket_id = config["ticket_counter"]
-    save_config(config)
+    Returns None if the topic isn't in the format written by
+    create_verification_channel.
+    """
+    fields = {}
+    for part in (topic or "").split("|"):
+        key, sep, value = part.partition(":")
+        if sep:
+            fields[key.strip()] = value.strip()
+    try:
+        return {
+            "user_id": int(fields["User ID"]),
+            "type": fields["Type"],
+            "ticket_id": int(fields["ID"])
+        }
+    except (KeyError, ValueError):
+        return None
+
+
+# Lowercases and replaces spaces with dashes in a single pass. Usernames are
+# lowercase ASCII under Discord's current naming rules, so Latin-1 suffices.
+_CHANNEL_NAME_TABLE = str.maketrans(
+    {c: c.lower() for c in map(chr, range(256))} | {" ": "-"}
+)
 
-    # Configure channel properties based on request type
-    if request_type == "citizen":
-        channel_name = f"citizen-{ticket_id}-{user.name}"
-        role_ids = [config["roles"]["border_control"]]
-        embed_color = discord.Color.green()
-        request_title = "Citizenship Verification Request"
-        displayed_text = "Assalamu alaikum, welcome to the digital borders of Kuwait!?\n" \
+# Per-request-type ticket settings. "instructions" is shown to the requester;
+# {code} is replaced with a fresh random code for every ticket.
+REQUEST_TYPES = {
+    "citizen": {
+        "role_keys": ("border_control",),
+        "color": discord.Color.green,
+        "title": "Citizenship Verification Request",
+        "instructions": "Assalamu alaikum, welcome to the digital borders of Kuwait!?\n" \
         "So you want to become a Kuwaiti citizen? Masha'Allah! But first, we need to make sure you're not a lost camel, a shady date merchant, or worse, a fan of that neighboring country. ???????\n\n"\
         "What do we need??\n" \
         "A screenshot of your in-game passport (no cat selfies unless your cat is Kuwaiti).?\n"\
         "Our immigration Office will review your request. Be patient, because as our grandfathers always said: \"Al-sabr miftah al-farah\" (Patience is the key to joy... and access to our Discord channel).?\n"\
         "Send this chill code to our Ministry of Foreign Affairs to prove you're not a spy (or worse, boring): ?\n\n"\
-        f"{secrets.token_urlsafe(10)}?\n\n"\
+        "{code}?\n\n"\
         "May your access be granted swiftly, and may you never run out of oil!?\n"\
-        "Shukran!\n"
-    elif request_type == "foreigner":
-        channel_name = f"foreigner-{ticket_id}-{user.name}"
-        role_ids = [config["roles"]["border_control"]]
-        embed_color = discord.Color.blue()
-        request_title = "Foreigner Verification Request"
-        displayed_text = "Assalamu alaikum, welcome to the Kuwaiti Hangout Zone!?\n" \
+        "Shukran!\n",
+    },
+    "foreigner": {
+        "role_keys": ("border_control",),
+        "color": discord.Color.blue,
+        "title": "Foreigner Verification Request",
+        "instructions": "Assalamu alaikum, welcome to the Kuwaiti Hangout Zone!?\n" \
         "So, you just want to chill with us? No problem! But first, we need to make sure you're not a lost tourist, a wandering sandstorm, or someone who thinks hummus is just a snack (it's a way of life here). ???????\n\n"\
         "What do we need from you??\n"\
         "A screenshot of your in-game passport (yes, even if you're just here for the vibes).?\n"\
         "Our Tourist centre will check your request faster than you can say \"Yalla, let's go!\" But remember: \"Al-sabr miftah al-farah\" (Patience is the key to joy... and entry).?\n"\
         "Send this chill code to our Ministry of Foreign Affairs to prove you're not a spy (or worse, boring): ?\n\n"\
-        f"{secrets.token_urlsafe(10)}?"\
+        "{code}?"\
         "May your stay be as smooth as our coffee, and your memes as valuable as our oil. ?\n"\
-        "Shukran!?\n"
-    else:  # embassy
-        channel_name = f"embassy-{ticket_id}-{user.name}"
+        "Shukran!?\n",
+    },
+    "embassy": {
         # Embassy requests notify multiple high-level roles
-        role_ids = [
-            config["roles"]["minister_foreign_affairs"],
-            config["roles"]["president"],
-            config["roles"]["vice_president"]
-        ]
-        embed_color = discord.Color.red()
-        request_title = "Emergency Embassy Request"
-        displayed_text = "Assalamu alaikum, welcome to the Embassy of Kuwait!?\n" \
+        "role_keys": ("minister_foreign_affairs", "president", "vice_president"),
+        "color": discord.Color.red,
+        "title": "Emergency Embassy Request",
+        "instructions": "Assalamu alaikum, welcome to the Embassy of Kuwait!?\n" \
         "So, you wish to enter the hallowed halls of our digital embassy? Excellent choice! But first, we must ensure you're not a rogue diplomat, a wandering desert trader, or heaven forbid a fan of that other Gulf country. ????????\n\n" \
         "What do we require??\n"\
         "A screenshot of your in-game passport (no, your selfie with a cat does not count).?\n"\
-        "Our esteemed moderators will review your request with the seriousness of a sheikh reviewing his camel herd. Patience is key, as they say: \"Al-sabr miftah al-farah\" (Patience is the key to joy... and embassy access).?\n"
-        "Send this top-secret code to our Ministry of Foreign Affairs as proof of your request:?\n\n"
-        f"{secrets.token_urlsafe(10)}?\n\n"\
-        "May your request be approved faster than a falcon in flight, and may your coffee always be strong. ?\n Shukran!?\n"
+        "Our esteemed moderators will review your request with the seriousness of a sheikh reviewing his camel herd. Patience is key, as they say: \"Al-sabr miftah al-farah\" (Patience is the key to joy... and embassy access).?\n"\
+        "Send this top-secret code to our Ministry of Foreign Affairs as proof of your request:?\n\n"\
+        "{code}?\n\n"\
+        "May your request be approved faster than a falcon in flight, and may your coffee always be strong. ?\n Shukran!?\n",
+    },
+}
+
+# Ticket channel permission overwrites. These are shared between tickets,
+# so they must never be modified in place.
+DENY_VIEW = discord.PermissionOverwrite(view_channel=False)
+USER_ACCESS = discord.PermissionOverwrite(
+    view_channel=True,
+    send_messages=True,
+    read_message_history=True
+)
+BOT_ACCESS = discord.PermissionOverwrite(
+    view_channel=True,
+    send_messages=True,
+    manage_channels=True,   # Required to delete the channel later
+    manage_messages=True,
+    embed_links=True
+)
+MOD_ACCESS = USER_ACCESS
+
+
+async def create_verification_channel(interaction: discord.Interaction, request_type: str) -> None:
+    """
+    Create a private verification ticket channel for the user.
+
+    Args:
+        interaction: The button interaction from the user
+        request_type: One of "citizen", "foreigner", or "embassy"
+
+    The channel is only visible to:
+    - The requesting user
+    - The bot itself
+    - The relevant moderator roles (Border Control or Embassy handlers)
+    """
+    guild = interaction.guild
+    user = interaction.user
+    me = guild.me
+    default_role = guild.default_role
+    # Direct access to discord.py's internal guild caches (see view_config)
+    roles_cache = guild._roles
+
+    # Generate unique ticket ID (locked so concurrent clicks can't share an ID)
+    async with ticket_lock:
+        config = get_config()
+        config["ticket_counter"] += 1
+        ticket_id = config["ticket_counter"]
+        await _save_config_async(config)
+
+    # Configure channel properties based on request type
+    spec = REQUEST_TYPES[request_type]
+    channel_name = f"{request_type}-{ticket_id}-{user.name}"
+    role_ids = [config["roles"][key] for key in spec["role_keys"]]
+    embed_color = spec["color"]()
+    request_title = spec["title"]
+    displayed_text = spec["instructions"].format(code=secrets.token_urlsafe(10))
 
     # Sanitize channel name (Discord requires lowercase, no spaces, max 100 chars)
-    channel_name = channel_name.lower().replace(" ", "-")[:100]
+    channel_name = channel_name.translate(_CHANNEL_NAME_TABLE)[:100]
 
     # Get the category to create the channel in (if configured)
     category = None
     if config["verification_category_id"]:
-        category = guild.get_channel(config["verification_category_id"])
+        category = guild._channels.get(config["verification_category_id"])
 
     # Set up channel permissions
     # By default, hide from everyone, then explicitly allow specific users/roles
     overwrites = {
-        guild.default_role: discord.PermissionOverwrite(view_channel=False),
-        user: discord.PermissionOverwrite(
-            view_channel=True,
-            send_messages=True,
-            read_message_history=True
-        ),
-        guild.me: discord.PermissionOverwrite(
-            view_channel=True,
-            send_messages=True,
-            manage_channels=True,   # Required to delete the channel later
-            manage_messages=True,
-            embed_links=True
-        )
+        default_role: DENY_VIEW,
+        user: USER_ACCESS,
+        me: BOT_ACCESS
     }
 
+    # Resolve the relevant moderator roles once (skipping unset or deleted ones)
+    mod_roles = [role for role in map(roles_cache.get, filter(None, role_ids)) if role]
+
     # Grant access to the relevant moderator roles
-    for role_id in role_ids:
-        if role_id:
-            role = guild.get_role(role_id)
-            if role:
-                overwrites[role] = discord.PermissionOverwrite(
-                    view_channel=True,
-                    send_messages=True,
-                    read_message_history=True
-                )
+    for role in mod_roles:
+        overwrites[role] = MOD_ACCESS
 
     # Check if bot has permission to create channels in the category
     if category:
-        bot_permissions = category.permissions_for(guild.me)
+        bot_permissions = category.permissions_for(me)
         if not bot_permissions.manage_channels:
             await interaction.response.send_message(
                 f"I don't have permission to create channels in the **{category.name}** category.\n\n"
@@ -287,20 +484,18 @@ async def create_verification_channel(interaction: discord.Interaction, request_
         await interaction.response.send_message(error_msg, ephemeral=True)
         return
 
+    # Remember the ticket so /approve and /deny don't need to parse the topic
+    TICKETS[channel.id] = {"user_id": user.id, "type": request_type, "ticket_id": ticket_id}
+
     # Build list of role mentions to ping
-    role_mentions = []
-    for role_id in role_ids:
-        if role_id:
-            role = guild.get_role(role_id)
-            if role:
-                role_mentions.append(role.mention)
+    role_mentions = [role.mention for role in mod_roles]
 
     # Create the ticket embed with request details
     embed = discord.Embed(
         title=f"📋 {request_title}",
         description=f"**User:** {user.mention}\n**Request Type:** {request_type.title()}\n**Ticket ID:** #{ticket_id}",
         color=embed_color,
-        timestamp=datetime.datetime.now(datetime.UTC)
+        timestamp=utcnow()
     )
     embed.set_thumbnail(url=user.display_avatar.url)
    
@@ -317,9 +512,8 @@ async def create_verification_channel(interaction: discord.Interaction, request_
     )
     embed.set_footer(text=f"User ID: {user.id}")
 
-    # Send the ticket message, pinging relevant moderators
-    mention_text = " ".join(role_mentions) if role_mentions else ""
-    await channel.send(content=mention_text, embed=embed)
+    # Send the ticket message, pinging relevant moderators (no content if none)
+    await channel.send(content=" ".join(role_mentions) or None, embed=embed)
 
     # Confirm to the user (only they can see this response)
     await interaction.response.send_message(
@@ -329,29 +523,124 @@ async def create_verification_channel(interaction: discord.Interaction, request_
     )
 
 
+# =============================================================================
+# WELCOME MESSAGE
+# =============================================================================
+
+# Static part of the welcome embed. Rebuilt only when the welcome message
+# changes (via /setup-message or a hand edit of config.json).
+_welcome_template = {}
+
+
+def _get_welcome_template(message: str) -> dict:
+    """Return the cached welcome embed template for the given message."""
+    global _welcome_template
+    if _welcome_template.get("description") != message:
+        _welcome_template = {
+            "type": "rich",
+            "title": "🇧🇪 Welcome to Belgium!",
+            "description": message,
+            "color": discord.Color.gold().value
+        }
+    return _welcome_template
+
+
+def _build_welcome_embed(member: discord.Member, message: str, *, test: bool = False) -> discord.Embed:
+    """
+    Build the welcome embed shown to a newly joined member.
+
+    With test=True the footer marks it as a preview (used by /test-welcome).
+    """
+    avatar_url = member.display_avatar.url
+    footer = "This is a test message" if test else f"Member #{member.guild.member_count}"
+
+    # Patch the per-member fields onto a copy of the template
+    return discord.Embed.from_dict(_get_welcome_template(message) | {
+        "timestamp": utcnow().isoformat(),
+        "thumbnail": {"url": avatar_url},
+        "author": {"name": member.name, "icon_url": avatar_url},
+        "footer": {"text": footer}
+    })
+
+
 # =============================================================================
 # BOT EVENTS
 # =============================================================================
 
 @bot.event
-async def on_ready():
+async def setup_hook():
     """
-    Called when the bot successfully connects to Discord.
+    Called once before the bot connects to Discord.
 
-    This registers the persistent button view and syncs slash commands.
+    Builds the single shared WelcomeView. Views need a running event loop,
+    so this can't happen at import time; doing it here (rather than in
+    on_ready, which fires again on every reconnect) guarantees one instance.
+    Slash commands are synced here for the same reason.
     """
-    print(f"✅ {bot.user} is now online!")
-    print(f"📊 Connected to {len(bot.guilds)} guild(s)")
+    global welcome_view
+    welcome_view = WelcomeView()
 
     # Register the persistent view so buttons work after restart
-    bot.add_view(WelcomeView())
+    bot.add_view(welcome_view)
 
-    # Sync slash commands with Discord
+    # Sync slash commands with Discord. Guild-scoped syncs apply immediately,
+    # while global ones can take up to an hour to propagate.
+    config = get_config()
     try:
-        synced = await bot.tree.sync()
+        if config["guild_id"]:
+            guild_obj = discord.Object(id=config["guild_id"])
+            bot.tree.copy_global_to(guild=guild_obj)
+            synced = await bot.tree.sync(guild=guild_obj)
+            # Remove global registrations left over from before guild_id was
+            # set, otherwise every command shows up twice in the guild
+            bot.tree.clear_commands(guild=None)
+            await bot.tree.sync()
+        else:
+            synced = await bot.tree.sync()
         print(f"🔄 Synced {len(synced)} command(s)")
     except Exception as e:
-        print(f"❌ Failed to sync commands: {e}")
+        logger.exception("Failed to sync commands: %s", e)
+
+
+@bot.event
+async def on_ready():
+    """
+    Called when the bot successfully connects to Discord.
+
+    This rebuilds the open-ticket index.
+    """
+    print(f"✅ {bot.user} is now online!")
+    print(f"📊 Connected to {len(bot.guilds)} guild(s)")
+
+    # Rebuild the open-ticket index from the ticket channels' topics
+    config = get_config()
+    if config["verification_category_id"]:
+        category = bot.get_channel(config["verification_category_id"])
+        if isinstance(category, discord.CategoryChannel):
+            for channel in category.text_channels:
+                ticket = _parse_ticket_topic(channel.topic)
+                if ticket:
+                    TICKETS[channel.id] = ticket
+
+    # Resolve configured roles and channels up front for single-server bots
+    if len(bot.guilds) == 1:
+        get_resolved(bot.guilds[0], config)
+
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    """Forget a ticket once its channel is gone (by /approve, /deny or by hand)."""
+    TICKETS.pop(channel.id, None)
+    # Only the log channel is cached; ticket deletions leave it valid
+    resolved = bot.resolved
+    if resolved and resolved.log_channel and channel.id == resolved.log_channel.id:
+        bot.resolved = None
+
+
+@bot.event
+async def on_guild_role_delete(role: discord.Role):
+    """Drop resolved roles, since a configured role may have been deleted."""
+    bot.resolved = None
 
 
 @bot.event
@@ -362,8 +651,7 @@ async def on_member_join(member: discord.Member):
     The message includes the configured welcome text and the
     three verification buttons (Citizen, Foreigner, Embassy).
     """
-    global config
-    config = load_config()
+    config = get_config()
 
     # Skip if no welcome channel is configured
     if not config["welcome_channel_id"]:
@@ -373,19 +661,9 @@ async def on_member_join(member: discord.Member):
     if not channel:
         return
 
-    # Create the welcome embed
-    embed = discord.Embed(
-        title="🇧🇪 Welcome to Belgium!",
-        description=config["welcome_message"],
-        color=discord.Color.gold(),
-        timestamp=datetime.datetime.now(datetime.UTC)
-    )
-    embed.set_thumbnail(url=member.display_avatar.url)
-    embed.set_author(name=member.name, icon_url=member.display_avatar.url)
-    embed.set_footer(text=f"Member #{member.guild.member_count}")
-
     # Send welcome message with verification buttons
-    await channel.send(content=member.mention, embed=embed, view=WelcomeView())
+    embed = _build_welcome_embed(member, config["welcome_message"])
+    await channel.send(content=member.mention, embed=embed, view=welcome_view)
 
 
 # =============================================================================
@@ -418,8 +696,7 @@ async def setup_roles(
 
     All parameters are optional - only provided roles will be updated.
     """
-    global config
-    config = load_config()
+    config = get_config()
 
     updated = []
 
@@ -446,10 +723,10 @@ async def setup_roles(
         config["roles"]["government"] = government.id
         updated.append(f"Government: {government.mention}")
 
-    save_config(config)
-
-    # Send confirmation
+    # Send confirmation (only touching the file if something changed)
     if updated:
+        await _save_config_async(config)
+        bot.resolved = None
         embed = discord.Embed(
             title="✅ Roles Updated",
             description="\n".join(updated),
@@ -483,8 +760,7 @@ async def setup_channels(
 
     All parameters are optional - only provided channels will be updated.
     """
-    global config
-    config = load_config()
+    config = get_config()
 
     updated = []
 
@@ -498,9 +774,9 @@ async def setup_channels(
         config["log_channel_id"] = log_channel.id
         updated.append(f"Log Channel: {log_channel.mention}")
 
-    save_config(config)
-
     if updated:
+        await _save_config_async(config)
+        bot.resolved = None
         embed = discord.Embed(
             title="✅ Channels Updated",
             description="\n".join(updated),
@@ -521,11 +797,10 @@ async def setup_channels(
 @app_commands.default_permissions(administrator=True)
 async def setup_message(interaction: discord.Interaction, message: str):
     """Set the custom welcome message displayed to new members."""
-    global config
-    config = load_config()
+    config = get_config()
 
     config["welcome_message"] = message
-    save_config(config)
+    await _save_config_async(config)
 
     embed = discord.Embed(
         title="✅ Welcome Message Updated",
@@ -540,23 +815,14 @@ async def setup_message(interaction: discord.Interaction, message: str):
 @app_commands.default_permissions(administrator=True)
 async def test_welcome(interaction: discord.Interaction):
     """Preview the welcome message without actually welcoming anyone."""
-    global config
-    config = load_config()
+    config = get_config()
 
-    embed = discord.Embed(
-        title="🏰 Welcome to Belgium!",
-        description=config["welcome_message"],
-        color=discord.Color.gold(),
-        timestamp=datetime.datetime.now(datetime.UTC)
-    )
-    embed.set_thumbnail(url=interaction.user.display_avatar.url)
-    embed.set_author(name=interaction.user.name, icon_url=interaction.user.display_avatar.url)
-    embed.set_footer(text="This is a test message")
+    embed = _build_welcome_embed(interaction.user, config["welcome_message"], test=True)
 
     await interaction.response.send_message(
         content="**Test Welcome Message:**",
         embed=embed,
-        view=WelcomeView(),
+        view=welcome_view,
         ephemeral=True
     )
 
@@ -565,17 +831,20 @@ async def test_welcome(interaction: discord.Interaction):
 @app_commands.default_permissions(administrator=True)
 async def view_config(interaction: discord.Interaction):
     """Display all current configuration settings."""
-    global config
-    config = load_config()
+    config = get_config()
 
     guild = interaction.guild
+    # Direct access to discord.py's internal guild caches (what get_role and
+    # get_channel wrap), skipping a method call per lookup
+    roles_cache = guild._roles
+    channels_cache = guild._channels
 
     # Format role configuration
     role_info = []
     for role_name, role_id in config["roles"].items():
         display_name = role_name.replace('_', ' ').title()
         if role_id:
-            role = guild.get_role(role_id)
+            role = roles_cache.get(role_id)
             role_info.append(f"**{display_name}:** {role.mention if role else 'Not found'}")
         else:
             role_info.append(f"**{display_name}:** Not set")
@@ -584,19 +853,19 @@ async def view_config(interaction: discord.Interaction):
     channel_info = []
 
     if config["welcome_channel_id"]:
-        ch = guild.get_channel(config["welcome_channel_id"])
+        ch = channels_cache.get(config["welcome_channel_id"])
         channel_info.append(f"**Welcome Channel:** {ch.mention if ch else 'Not found'}")
     else:
         channel_info.append("**Welcome Channel:** Not set")
 
     if config["verification_category_id"]:
-        cat = guild.get_channel(config["verification_category_id"])
+        cat = channels_cache.get(config["verification_category_id"])
         channel_info.append(f"**Verification Category:** {cat.name if cat else 'Not found'}")
     else:
         channel_info.append("**Verification Category:** Not set")
 
     if config.get("log_channel_id"):
-        log_ch = guild.get_channel(config["log_channel_id"])
+        log_ch = channels_cache.get(config["log_channel_id"])
         channel_info.append(f"**Log Channel:** {log_ch.mention if log_ch else 'Not found'}")
     else:
         channel_info.append("**Log Channel:** Not set")
@@ -612,171 +881,310 @@ async def view_config(interaction: discord.Interaction):
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
+@bot.tree.command(name="reload-config", description="Reload the configuration from config.json")
+@app_commands.default_permissions(administrator=True)
+async def reload_config(interaction: discord.Interaction):
+    """Discard the in-memory configuration and read config.json again."""
+    # Hold the write lock so an in-flight save can't land on top of the fresh copy
+    async with _config_write_lock:
+        config = await asyncio.to_thread(_read_config_file)
+        _config_cache.update(config)
+    bot.resolved = None
+    get_resolved(interaction.guild, config)
+
+    embed = discord.Embed(
+        title="✅ Configuration Reloaded",
+        description=f"Settings were re-read from `{CONFIG_FILE}`.",
+        color=discord.Color.green()
+    )
+
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
 # =============================================================================
 # MODERATION COMMANDS
 # =============================================================================
 
-@bot.tree.command(name="approve", description="Approve a verification request")
-@app_commands.describe(reason="Internal reason for approval (not shown to user)")
-async def approve(interaction: discord.Interaction, reason: str = "No reason provided"):
+_USER_ID_RE = re.compile(r"User ID:\s*(\d+)")
+
+
+def _extract_user_id(channel: discord.TextChannel) -> int | None:
     """
-    Approve a verification request in the current ticket channel.
+    Get the requester's user ID for a ticket channel.
 
-    This will:
-    1. Assign the appropriate role to the user (local_role/Foreigner)
-    2. Notify the user of approval
-    3. Log the decision to the government log channel
-    4. Delete the ticket channel after 30 seconds
+    Uses the in-memory ticket index, falling back to the channel topic
+    for tickets this process doesn't know about.
+    """
+    ticket = TICKETS.get(channel.id)
+    if ticket:
+        return ticket["user_id"]
+    match = _USER_ID_RE.search(channel.topic or "")
+    return int(match.group(1)) if match else None
 
-    The reason is only visible in the log channel, not to the user.
+
+def _is_moderator(interaction: discord.Interaction, resolved: ResolvedConfig) -> bool:
+    """Check whether the user holds a moderator role or is an administrator."""
+    user_role_ids = {role.id for role in interaction.user.roles}
+    if not user_role_ids.isdisjoint(resolved.mod_role_ids):
+        return True
+    return interaction.user.guild_permissions.administrator
+
+
+# Caps concurrent moderation REST calls so bursts of decisions from several
+# moderators don't pile into Discord's global rate limit together
+_discord_semaphore = asyncio.Semaphore(5)
+_DISCORD_CALL_ATTEMPTS = 3
+
+
+async def _discord_call(coro_fn, *args, **kwargs):
+    """
+    Run a Discord REST call under the shared semaphore, retrying on 429s.
+
+    discord.py already waits out most rate limits internally; this retries
+    the ones that still reach us (RateLimited, or a 429 HTTPException),
+    sleeping for as long as Discord asks.
+    """
+    for attempt in range(_DISCORD_CALL_ATTEMPTS):
+        last_attempt = attempt == _DISCORD_CALL_ATTEMPTS - 1
+        try:
+            async with _discord_semaphore:
+                return await coro_fn(*args, **kwargs)
+        except discord.RateLimited as e:
+            if last_attempt:
+                raise
+            await asyncio.sleep(e.retry_after)
+        except discord.HTTPException as e:
+            if e.status != 429 or last_attempt:
+                raise
+            await asyncio.sleep(float(e.response.headers.get("Retry-After", 1)))
+
+
+# Strong references to pending background tasks so they aren't garbage
+# collected before they finish
+_background_tasks = set()
+
+
+async def _delete_channel_later(channel: discord.TextChannel, reason: str, delay: int = 30) -> None:
+    """Delete a ticket channel after a delay."""
+    await asyncio.sleep(delay)
+    try:
+        await _discord_call(channel.delete, reason=reason)
+    except (discord.HTTPException, discord.RateLimited) as e:
+        # Runs in a detached task, so nothing else would ever see the error
+        # (covers NotFound/Forbidden as well as 5xx and exhausted 429 retries)
+        logger.warning("Could not delete channel: %s", e)
+
+
+def _schedule_delete(channel: discord.TextChannel, reason: str) -> None:
+    """Delete a ticket channel in the background once the user has read the outcome."""
+    task = asyncio.create_task(_delete_channel_later(channel, reason))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _embed_template(title: str, color: discord.Color, footer: str | None = None) -> discord.Embed:
+    """Build a static embed to be copied and filled in per use."""
+    embed = discord.Embed(title=title, color=color)
+    if footer:
+        embed.set_footer(text=footer)
+    return embed
+
+
+# Wording and embed templates for each outcome of /approve (True) and /deny (False).
+# Templates are shared - always .copy() them before filling in details. Embed.copy()
+# is shallow, so templates must not have fields (copies would share the list).
+_DECISIONS = {
+    True: {
+        "verb": "approved",
+        "by": "Approved by",
+        "user_description": "Your {request_type} verification request has been approved!",
+        "user_embed": _embed_template("✅ Request Approved!", discord.Color.green(), "This channel will be deleted in 30 seconds."),
+        "log_embed": _embed_template("✅ Verification Approved", discord.Color.green()),
+        "mod_embed": _embed_template("📝 Approval Logged", discord.Color.green())
+    },
+    False: {
+        "verb": "denied",
+        "by": "Denied by",
+        "user_description": "Your {request_type} verification request has been denied.",
+        "user_embed": _embed_template("❌ Request Denied", discord.Color.red(), "This channel will be deleted in 30 seconds."),
+        "log_embed": _embed_template("❌ Verification Denied", discord.Color.red()),
+        "mod_embed": _embed_template("📝 Denial Logged", discord.Color.red())
+    }
+}
+
+
+async def _handle_decision(interaction: discord.Interaction, reason: str, approved: bool) -> None:
     """
-    global config
-    config = load_config()
+    Approve or deny the verification request in the current ticket channel.
+
+    Shared implementation of /approve and /deny. Approvals require the
+    requester to still be in the server; denials go ahead regardless.
+    """
+    # Acknowledge right away: rate-limited REST calls below may take longer
+    # than Discord's 3-second window for the first response
+    await interaction.response.defer(ephemeral=True)
+
+    config = get_config()
+    resolved = get_resolved(interaction.guild, config)
+    decision = _DECISIONS[approved]
 
     channel = interaction.channel
 
-    # Verify this is a ticket channel
-    if not channel.name.startswith(("citizen-", "foreigner-", "embassy-")):
-        await interaction.response.send_message(
+    # Verify this is a ticket channel (named "<request type>-<ticket id>-<user>")
+    request_type, sep, _ = channel.name.partition("-")
+    if not sep or request_type not in REQUEST_TYPES:
+        await interaction.followup.send(
             "This command can only be used in verification channels.",
             ephemeral=True
         )
         return
 
     # Check if the user has permission to moderate
-    mod_roles = [
-        config["roles"]["border_control"],
-        config["roles"]["minister_foreign_affairs"],
-        config["roles"]["president"],
-        config["roles"]["vice_president"]
-    ]
-
-    user_role_ids = [role.id for role in interaction.user.roles]
-    has_permission = any(role_id in user_role_ids for role_id in mod_roles if role_id)
-
-    if not has_permission and not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message(
+    if not _is_moderator(interaction, resolved):
+        await interaction.followup.send(
             "You don't have permission to use this command.",
             ephemeral=True
         )
         return
 
-    # Extract user ID from channel topic (set during channel creation)
-    topic = channel.topic or ""
-    user_id = None
-    for part in topic.split("|"):
-        if "User ID:" in part:
-            try:
-                user_id = int(part.split(":")[-1].strip())
-            except ValueError:
-                pass
+    # Look up the requester
+    user_id = _extract_user_id(channel)
+    member = interaction.guild.get_member(user_id) if user_id else None
 
-    if not user_id:
-        await interaction.response.send_message(
+    if approved and not user_id:
+        await interaction.followup.send(
             "Could not find the user for this request. Please check manually.",
             ephemeral=True
         )
         return
 
-    member = interaction.guild.get_member(user_id)
-    if not member:
-        await interaction.response.send_message(
+    if approved and not member:
+        await interaction.followup.send(
             "The user is no longer in the server.",
             ephemeral=True
         )
         return
 
+    moderator = interaction.user
+
     # Determine which role to grant based on request type
-    request_type = channel.name.split("-")[0]
+    # (embassy requests and denials don't grant a role)
     role_to_give = None
-
-    if request_type == "citizen":
-        role_to_give = interaction.guild.get_role(config["roles"]["local_role"])
-    elif request_type == "foreigner":
-        role_to_give = interaction.guild.get_role(config["roles"]["foreigner"])
-    # Embassy requests don't grant a role
+    if approved:
+        if request_type == "citizen":
+            role_to_give = resolved.local_role
+        elif request_type == "foreigner":
+            role_to_give = resolved.foreigner_role
 
     # Attempt to assign the role
     if role_to_give:
         try:
-            await member.add_roles(role_to_give)
+            # A single role is one atomic PUT; a PATCH of the full role list
+            # would cost the same request and could undo concurrent role changes
+            await _discord_call(member.add_roles, role_to_give, reason=f"Approved by {moderator.name}")
         except discord.Forbidden:
             # This usually means the bot's role is lower than the target role
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"I don't have permission to assign the {role_to_give.name} role. "
                 "Make sure my bot role is **higher** than this role in Server Settings > Roles.",
                 ephemeral=True
             )
             return
         except discord.HTTPException as e:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Failed to assign role: {e}",
                 ephemeral=True
             )
             return
 
-    # Notify the user of approval (reason is NOT included)
-    user_embed = discord.Embed(
-        title="✅ Request Approved!",
-        description=f"Your {request_type} verification request has been approved!",
-        color=discord.Color.green()
-    )
+    member_mention = member.mention if member else "Unknown"
+
+    # Notify the user of the decision (reason is NOT included)
+    user_embed = decision["user_embed"].copy()
+    user_embed.description = decision["user_description"].format(request_type=request_type)
     if role_to_give:
         user_embed.add_field(name="Role Granted", value=role_to_give.mention, inline=False)
-    user_embed.set_footer(text="This channel will be deleted in 30 seconds.")
 
-    await channel.send(content=member.mention, embed=user_embed)
+    # Build the government log entry (includes reason)
+    log_configured = bool(config.get("log_channel_id") or config.get("log_webhook_url"))
+    log_channel = resolved.log_channel
+    log_webhook = resolved.log_webhook
+    if log_webhook or log_channel:
+        log_embed = decision["log_embed"].copy()
+        log_embed.description = (
+            f"**User:** {member_mention} ({member.name if member else 'Unknown'})\n"
+            f"**Type:** {request_type.title()}\n"
+            f"**Reason:** {reason}"
+        )
+        log_embed.timestamp = utcnow()
+        if member:
+            log_embed.set_thumbnail(url=member.display_avatar.url)
+        log_embed.set_footer(
+            text=f"{decision['by']} {moderator.name}",
+            icon_url=moderator.display_avatar.url
+        )
+        if role_to_give:
+            log_embed.add_field(name="Role Granted", value=role_to_give.mention, inline=True)
+    elif config.get("log_channel_id"):
+        logger.warning("Log channel not found: %s", config["log_channel_id"])
+
+    # Notify the user and post the log entry concurrently
+    sends = [_discord_call(channel.send, content=member.mention if member else None, embed=user_embed)]
+    if log_webhook:
+        sends.append(_discord_call(log_webhook.send, embed=log_embed, username="Verification Log"))
+    elif log_channel:
+        sends.append(_discord_call(log_channel.send, embed=log_embed))
+    results = await asyncio.gather(*sends, return_exceptions=True)
+
+    if isinstance(results[0], BaseException):
+        raise results[0]
 
-    # Log to the government log channel (includes reason)
     log_posted = False
-    if config.get("log_channel_id"):
-        log_channel = interaction.guild.get_channel(config["log_channel_id"])
-        if log_channel:
-            try:
-                log_embed = discord.Embed(
-                    title="✅ Verification Approved",
-                    description=f"**User:** {member.mention} ({member.name})\n"
-                               f"**Type:** {request_type.title()}\n"
-                               f"**Reason:** {reason}",
-                    color=discord.Color.green(),
-                    timestamp=datetime.datetime.now(datetime.UTC)
-                )
-                log_embed.set_thumbnail(url=member.display_avatar.url)
-                log_embed.set_footer(
-                    text=f"Approved by {interaction.user.name}",
-                    icon_url=interaction.user.display_avatar.url
-                )
-                if role_to_give:
-                    log_embed.add_field(name="Role Granted", value=role_to_give.mention, inline=True)
-                await log_channel.send(embed=log_embed)
-                log_posted = True
-            except discord.Forbidden:
-                print("Cannot post to log channel - missing permissions")
-            except discord.HTTPException as e:
-                print(f"Failed to post to log channel: {e}")
+    if len(results) > 1:
+        log_result = results[1]
+        if isinstance(log_result, discord.Forbidden):
+            logger.warning("Cannot post to log channel - missing permissions")
+        elif isinstance(log_result, discord.HTTPException):
+            logger.warning("Failed to post to log channel: %s", log_result)
+        elif isinstance(log_result, BaseException):
+            raise log_result
         else:
-            print(f"Log channel not found: {config['log_channel_id']}")
+            log_posted = True
 
     # Confirm to the moderator (ephemeral)
-    mod_embed = discord.Embed(
-        title="📝 Approval Logged",
-        description=f"**User:** {member.mention}\n**Type:** {request_type}\n**Reason:** {reason}",
-        color=discord.Color.green()
+    mod_embed = decision["mod_embed"].copy()
+    mod_embed.description = (
+        f"**User:** {member_mention}\n"
+        f"**Type:** {request_type}\n"
+        f"**Reason:** {reason}"
     )
-    mod_embed.set_footer(text=f"Approved by {interaction.user.name}")
+    mod_embed.set_footer(text=f"{decision['by']} {moderator.name}")
 
     # Warn if log posting failed
-    if not log_posted and config.get("log_channel_id"):
+    if not log_posted and log_configured:
         mod_embed.add_field(name="⚠️ Warning", value="Could not post to log channel", inline=False)
 
-    await interaction.response.send_message(embed=mod_embed, ephemeral=True)
+    await interaction.followup.send(embed=mod_embed, ephemeral=True)
 
-    # Delete the ticket channel after a delay
-    await asyncio.sleep(30)
-    try:
-        await channel.delete(reason=f"Verification approved by {interaction.user.name}")
-    except (discord.NotFound, discord.Forbidden) as e:
-        print(f"Could not delete channel: {e}")
+    # Delete the ticket channel after a delay, without holding the command open
+    _schedule_delete(channel, f"Verification {decision['verb']} by {moderator.name}")
+
+
+@bot.tree.command(name="approve", description="Approve a verification request")
+@app_commands.describe(reason="Internal reason for approval (not shown to user)")
+async def approve(interaction: discord.Interaction, reason: str = "No reason provided"):
+    """
+    Approve a verification request in the current ticket channel.
+
+    This will:
+    1. Assign the appropriate role to the user (local_role/Foreigner)
+    2. Notify the user of approval
+    3. Log the decision to the government log channel
+    4. Delete the ticket channel after 30 seconds
+
+    The reason is only visible in the log channel, not to the user.
+    """
+    await _handle_decision(interaction, reason, approved=True)
 
 
 @bot.tree.command(name="deny", description="Deny a verification request")
@@ -790,115 +1198,7 @@ async def deny(interaction: discord.Interaction, reason: str = "No reason provid
     2. Log the decision with reason to the government log channel
     3. Delete the ticket channel after 30 seconds
     """
-    global config
-    config = load_config()
-
-    channel = interaction.channel
-
-    # Verify this is a ticket channel
-    if not channel.name.startswith(("citizen-", "foreigner-", "embassy-")):
-        await interaction.response.send_message(
-            "This command can only be used in verification channels.",
-            ephemeral=True
-        )
-        return
-
-    # Check if the user has permission to moderate
-    mod_roles = [
-        config["roles"]["border_control"],
-        config["roles"]["minister_foreign_affairs"],
-        config["roles"]["president"],
-        config["roles"]["vice_president"]
-    ]
-
-    user_role_ids = [role.id for role in interaction.user.roles]
-    has_permission = any(role_id in user_role_ids for role_id in mod_roles if role_id)
-
-    if not has_permission and not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message(
-            "You don't have permission to use this command.",
-            ephemeral=True
-        )
-        return
-
-    # Extract user ID from channel topic
-    topic = channel.topic or ""
-    user_id = None
-    for part in topic.split("|"):
-        if "User ID:" in part:
-            try:
-                user_id = int(part.split(":")[-1].strip())
-            except ValueError:
-                pass
-
-    member = interaction.guild.get_member(user_id) if user_id else None
-    request_type = channel.name.split("-")[0]
-
-    # Notify the user of denial (reason is NOT included)
-    user_embed = discord.Embed(
-        title="❌ Request Denied",
-        description=f"Your {request_type} verification request has been denied.",
-        color=discord.Color.red()
-    )
-    user_embed.set_footer(text="This channel will be deleted in 30 seconds.")
-
-    if member:
-        await channel.send(content=member.mention, embed=user_embed)
-    else:
-        await channel.send(embed=user_embed)
-
-    # Log to the government log channel (includes reason)
-    log_posted = False
-    if config.get("log_channel_id"):
-        log_channel = interaction.guild.get_channel(config["log_channel_id"])
-        if log_channel:
-            try:
-                log_embed = discord.Embed(
-                    title="❌ Verification Denied",
-                    description=f"**User:** {member.mention if member else 'Unknown'} "
-                               f"({member.name if member else 'Unknown'})\n"
-                               f"**Type:** {request_type.title()}\n"
-                               f"**Reason:** {reason}",
-                    color=discord.Color.red(),
-                    timestamp=datetime.datetime.now(datetime.UTC)
-                )
-                if member:
-                    log_embed.set_thumbnail(url=member.display_avatar.url)
-                log_embed.set_footer(
-                    text=f"Denied by {interaction.user.name}",
-                    icon_url=interaction.user.display_avatar.url
-                )
-                await log_channel.send(embed=log_embed)
-                log_posted = True
-            except discord.Forbidden:
-                print("Cannot post to log channel - missing permissions")
-            except discord.HTTPException as e:
-                print(f"Failed to post to log channel: {e}")
-        else:
-            print(f"Log channel not found: {config['log_channel_id']}")
-
-    # Confirm to the moderator (ephemeral)
-    mod_embed = discord.Embed(
-        title="📝 Denial Logged",
-        description=f"**User:** {member.mention if member else 'Unknown'}\n"
-                   f"**Type:** {request_type}\n"
-                   f"**Reason:** {reason}",
-        color=discord.Color.red()
-    )
-    mod_embed.set_footer(text=f"Denied by {interaction.user.name}")
-
-    # Warn if log posting failed
-    if not log_posted and config.get("log_channel_id"):
-        mod_embed.add_field(name="⚠️ Warning", value="Could not post to log channel", inline=False)
-
-    await interaction.response.send_message(embed=mod_embed, ephemeral=True)
-
-    # Delete the ticket channel after a delay
-    await asyncio.sleep(30)
-    try:
-        await channel.delete(reason=f"Verification denied by {interaction.user.name}")
-    except (discord.NotFound, discord.Forbidden) as e:
-        print(f"Could not delete channel: {e}")
+    await _handle_decision(interaction, reason, approved=False)
 
 
 # =============================================================================
@@ -906,11 +1206,12 @@ async def deny(interaction: discord.Interaction, reason: str = "No reason provid
 # =============================================================================
 
 if __name__ == "__main__":
-    import sys
-    load_dotenv()
-
-    # Get bot token from environment variable or command line argument
+    # Get bot token from environment variable (.env file only read if it's not
+    # already set) or command line argument
     token = os.getenv("DISCORD_BOT_TOKEN")
+    if not token:
+        load_dotenv()
+        token = os.getenv("DISCORD_BOT_TOKEN")
 
     if not token and len(sys.argv) > 1:
         token = sys.argv[1]
@@ -921,4 +1222,24 @@ if __name__ == "__main__":
         print("  python bot.py YOUR_BOT_TOKEN")
         sys.exit(1)
 
-    bot.run(token)
+    # Use the libuv-based event loop when installed
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    # Write our log records from a background thread so console output
+    # never blocks the event loop
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(
+        "[%(asctime)s] [%(levelname)-8s] %(name)s: %(message)s", "%Y-%m-%d %H:%M:%S"
+    ))
+    log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    log_listener.start()
+
+    try:
+        bot.run(token)
+    finally:
+        log_listener.stop()